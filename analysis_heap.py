@@ -1,13 +1,20 @@
 # analysis.py
 
-import sys
-sys.setrecursionlimit(10000)
-
+import argparse
+import cProfile
+import io
+import pstats
 import time
 import random
+import tracemalloc
+from array import array as typed_array
 from heap import MinHeap, MaxHeap
-from heapsort import heapsort, heapsort_inplace
+from heapsort import heapsort, heapsort_inplace, heapsort_argsort
+from graph_search import (INF, QUEUE_ENGINES, CSRGraph, astar, dijkstra, grid_graph,
+                          grid_heuristic, random_graph, shortest_path)
+from merge import merge
 from priority_queue import PriorityQueue
+from running_median import RunningMedian
 
 def test_heap_operations():
     """Тестирование основных операций кучи"""
@@ -65,6 +72,57 @@ def test_heap_operations():
     print(f"   После build_heap: {heap.heap}")
     print(f"   Куча валидна: {heap.is_valid_heap()}")
 
+    # Тест visualize: обрезка, сводка, запись в поток
+    print("\n4. Тест visualize:")
+    heap = MinHeap()
+    heap.build_heap(list(range(15)))  # Полное дерево из 4 уровней
+
+    lines = heap.visualize(max_depth=1).split("\n")
+    markers = [line for line in lines if "..." in line]
+    ok = len(lines) == 7 and len(markers) == 4 and all("(3 узлов)" in line for line in markers)
+    print(f"   {'✓' if ok else '✗'} max_depth=1: 3 узла и 4 маркера '... (3 узлов)'")
+
+    lines = heap.visualize(max_nodes=10).split("\n")
+    nodes = [line for line in lines if "..." not in line]
+    ok = len(nodes) == 7 and len(lines) == 15
+    print(f"   {'✓' if ok else '✗'} max_nodes=10: 7 узлов верхних уровней и 8 маркеров")
+
+    lines = heap.visualize(summary=True).split("\n")
+    ok = len(lines) == 4 and lines[-1] == "Уровень 3: узлов 8, min=7, max=14"
+    print(f"   {'✓' if ok else '✗'} summary=True: {lines[-1]}")
+
+    buffer = io.StringIO()
+    result = heap.visualize(out=buffer)
+    ok = result is None and buffer.getvalue().rstrip("\n") == heap.visualize()
+    print(f"   {'✓' if ok else '✗'} out=StringIO: вывод совпадает со строковым")
+
+    # Отсортированный массив - корректная min-heap, build_heap не нужен
+    big = MinHeap()
+    big.heap = list(range(2 ** 17 - 1))
+    buffer = io.StringIO()
+    big.visualize(out=buffer)
+    ok = buffer.getvalue().count("\n") == big.size()
+    print(f"   {'✓' if ok else '✗'} Полный вывод {big.size()} узлов в поток построчно")
+
+    # Тест выборочной проверки
+    print("\n5. Тест is_valid_heap(sample):")
+    rng = random.Random(0)
+    ok = big.is_valid_heap(sample=100, rng=rng)
+    print(f"   {'✓' if ok else '✗'} Корректная куча проходит выборочную проверку")
+
+    # Обратный порядок нарушает свойство кучи в каждом родителе,
+    # поэтому любая выборка обязана найти нарушение
+    broken = MinHeap()
+    broken.heap = list(range(1000, 0, -1))
+    ok = not broken.is_valid_heap(sample=10, rng=rng)
+    print(f"   {'✓' if ok else '✗'} Испорченная куча обнаружена по выборке из 10 узлов")
+
+    try:
+        big.is_valid_heap(sample=0)
+        print("   ✗ sample=0 не вызвал исключение")
+    except ValueError:
+        print("   ✓ sample=0 → ValueError")
+
     print("\n" + "="*70)
 
 
@@ -97,6 +155,24 @@ def test_heapsort():
         status = "✓" if arr_copy == expected else "✗"
         print(f"   {status} {arr} → {arr_copy}")
 
+    print("\n3. Тест на array.array и memoryview:")
+    typed = typed_array('d', [3.5, 1.25, 2.0, 0.5])
+    sorted_typed = heapsort(typed)
+    status = "✓" if list(sorted_typed) == sorted(typed) else "✗"
+    print(f"   {status} {typed} → {sorted_typed}")
+
+    buffer = bytearray([9, 4, 7, 1])
+    heapsort_inplace(memoryview(buffer))
+    status = "✓" if list(buffer) == [1, 4, 7, 9] else "✗"
+    print(f"   {status} memoryview → {list(buffer)}")
+
+    print("\n4. Тест argsort:")
+    for arr in test_arrays:
+        order = heapsort_argsort(arr)
+        expected = sorted(range(len(arr)), key=lambda i: arr[i])
+        status = "✓" if order == expected else "✗"
+        print(f"   {status} {arr} → {order}")
+
     print("\n" + "="*70)
 
 
@@ -137,6 +213,41 @@ def test_priority_queue():
     print("\n" + "="*70)
 
 
+def test_graph_search():
+    """Тестирование поиска кратчайших путей на графе с известным ответом"""
+    print("="*70)
+    print("ТЕСТИРОВАНИЕ ПОИСКА КРАТЧАЙШИХ ПУТЕЙ")
+    print("="*70)
+
+    # 0 -4-> 1, 0 -1-> 2, 2 -2-> 1, 1 -5-> 3: путь 0-2-1-3 длины 8
+    graph = CSRGraph.from_edges(4, [(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 5)])
+    expected_dist = [0, 3, 1, 8]
+    expected_path = [0, 2, 1, 3]
+
+    print(f"\n   Ожидаемые расстояния: {expected_dist}, путь до 3: {expected_path}")
+    print("\n1. Дейкстра и A* для каждого движка:")
+    for engine in QUEUE_ENGINES:
+        dist, prev = dijkstra(graph, 0, engine=engine)
+        path = shortest_path(prev, 0, 3)
+        distance, astar_path = astar(graph, 0, 3, lambda node: 0, engine=engine)
+        ok = (dist == expected_dist and path == expected_path
+              and distance == 8 and astar_path == expected_path)
+        status = "✓" if ok else "✗"
+        print(f"   {status} {engine}: dist={dist}, путь={path}, A*=({distance}, {astar_path})")
+
+    print("\n2. Ранний выход до цели 2 (вершины 1 и 3 не обработаны):")
+    dist, _ = dijkstra(graph, 0, target=2)
+    status = "✓" if dist == [0, INF, 1, INF] else "✗"
+    print(f"   {status} dist={dist}")
+
+    print("\n3. Эталонная Дейкстра с дубликатами:")
+    dist = dijkstra_reference(graph, 0)
+    status = "✓" if dist == expected_dist else "✗"
+    print(f"   {status} dist={dist}")
+
+    print("\n" + "="*70)
+
+
 def compare_build_methods():
     """Сравнение методов построения кучи"""
     print("="*70)
@@ -234,6 +345,213 @@ def compare_sorting_algorithms():
     return results
 
 
+def compare_running_median():
+    """Сравнение скользящей медианы: пересортировка окна vs две кучи"""
+    print("="*70)
+    print("СРАВНЕНИЕ МЕТОДОВ СКОЛЬЗЯЩЕЙ МЕДИАНЫ")
+    print("="*70)
+
+    windows = [10, 100, 500]
+    samples = 2000
+
+    print(f"\n{'Окно':<10} {'heapsort окна (с)':<22} {'RunningMedian (с)':<20} {'Ускорение':<12} {'Совпадает'}")
+    print("-" * 70)
+
+    results = []
+
+    for window in windows:
+        stream = [random.randint(1, 100000) for _ in range(samples)]
+
+        # Метод 1: Пересортировка окна на каждом отсчете
+        start = time.time()
+        medians_sort = []
+        for i in range(len(stream)):
+            ordered = heapsort(stream[max(0, i - window + 1):i + 1])
+            mid = len(ordered) // 2
+            if len(ordered) % 2:
+                medians_sort.append(ordered[mid])
+            else:
+                medians_sort.append((ordered[mid - 1] + ordered[mid]) / 2)
+        time_sort = time.time() - start
+
+        # Метод 2: Две кучи с ленивым удалением
+        start = time.time()
+        tracker = RunningMedian(window=window)
+        medians_heap = []
+        for value in stream:
+            tracker.add(value)
+            medians_heap.append(tracker.value())
+        time_heap = time.time() - start
+
+        speedup = time_sort / time_heap if time_heap > 0 else 0
+        match = medians_sort == medians_heap
+        results.append({
+            'window': window,
+            'resort': time_sort,
+            'heaps': time_heap,
+            'speedup': speedup,
+            'match': match
+        })
+
+        status = "✓" if match else "✗"
+        speedup_text = f"{speedup:.2f}x"
+        print(f"{window:<10} {time_sort:<22.6f} {time_heap:<20.6f} {speedup_text:<12} {status}")
+
+    print("\n" + "="*70)
+    return results
+
+
+def compare_merge_methods():
+    """Сравнение слияния отсортированных шардов: heapsort vs k-way merge"""
+    print("="*70)
+    print("СРАВНЕНИЕ МЕТОДОВ СЛИЯНИЯ ОТСОРТИРОВАННЫХ ШАРДОВ")
+    print("="*70)
+
+    # (количество шардов, размер шарда): мало больших и много маленьких
+    configs = [(4, 12500), (16, 3125), (100, 500), (500, 100)]
+
+    print(f"\n{'Шарды':<10} {'Размер':<10} {'heapsort (с)':<18} {'merge (с)':<15} {'Ускорение':<12} {'Совпадает'}")
+    print("-" * 70)
+
+    results = []
+
+    for shards, shard_size in configs:
+        inputs = [sorted(random.randint(1, 100000) for _ in range(shard_size))
+                  for _ in range(shards)]
+
+        # Метод 1: Конкатенация и heapsort (исходный порядок теряется)
+        start = time.time()
+        concatenated = []
+        for shard in inputs:
+            concatenated.extend(shard)
+        result_sort = heapsort(concatenated)
+        time_sort = time.time() - start
+
+        # Метод 2: k-путевое слияние
+        start = time.time()
+        result_merge = list(merge(*inputs))
+        time_merge = time.time() - start
+
+        speedup = time_sort / time_merge if time_merge > 0 else 0
+        match = result_sort == result_merge
+        results.append({
+            'shards': shards,
+            'shard_size': shard_size,
+            'heapsort': time_sort,
+            'merge': time_merge,
+            'speedup': speedup,
+            'match': match
+        })
+
+        status = "✓" if match else "✗"
+        speedup_text = f"{speedup:.2f}x"
+        print(f"{shards:<10} {shard_size:<10} {time_sort:<18.6f} {time_merge:<15.6f} {speedup_text:<12} {status}")
+
+    print("\n" + "="*70)
+    return results
+
+
+def compare_graph_engines(grid_side=100, nodes=10000, edges=50000, repeat=1,
+                          engines=None, seed=None):
+    """
+    Сравнение движков очереди в алгоритмах Дейкстры и A*
+
+    Args:
+        grid_side: Сторона квадратной решетки
+        nodes: Количество вершин случайного графа
+        edges: Количество случайных ребер
+        repeat: Количество повторов (берется лучшее время)
+        engines: Имена движков из QUEUE_ENGINES (None - все)
+        seed: Зерно генератора случайных чисел
+    """
+    print("="*70)
+    print("СРАВНЕНИЕ ДВИЖКОВ ОЧЕРЕДИ В ПОИСКЕ КРАТЧАЙШИХ ПУТЕЙ")
+    print("="*70)
+
+    if repeat < 1:
+        raise ValueError("Количество повторов должно быть положительным")
+
+    engines = engines or list(QUEUE_ENGINES)
+    target = grid_side * grid_side - 1
+    graphs = [
+        (f"решетка {grid_side}x{grid_side}", grid_graph(grid_side, grid_side, seed=seed),
+         grid_heuristic(grid_side, target), target),
+        (f"случайный {nodes}/{edges}", random_graph(nodes, edges, seed=seed),
+         None, nodes // 2),
+    ]
+
+    print(f"\n{'Граф':<24} {'Движок':<10} {'Дейкстра (с)':<15} {'До цели (с)':<15} {'A* (с)':<12} {'Совпадает'}")
+    print("-" * 85)
+
+    def best_time(run):
+        """Лучшее время из repeat запусков и результат последнего"""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = run()
+            timings.append(time.perf_counter() - start)
+        return min(timings), value
+
+    results = []
+
+    for name, graph, heuristic, goal in graphs:
+        # Независимый эталон: Дейкстра с дубликатами в PriorityQueue
+        reference = dijkstra_reference(graph, 0)
+
+        for engine in engines:
+            time_full, (dist, _) = best_time(lambda: dijkstra(graph, 0, engine=engine))
+            time_target, (dist_target, _) = best_time(lambda: dijkstra(graph, 0, target=goal, engine=engine))
+            if heuristic is not None:
+                time_astar, (distance, _) = best_time(
+                    lambda: astar(graph, 0, goal, heuristic, engine=engine))
+                astar_text = f"{time_astar:.6f}"
+            else:
+                time_astar, distance = None, dist[goal]
+                astar_text = "-"
+
+            # Каждый движок сверяется с эталонными расстояниями
+            match = (dist == reference and dist_target[goal] == reference[goal]
+                     and distance == reference[goal])
+
+            results.append({
+                'graph': name,
+                'engine': engine,
+                'dijkstra': time_full,
+                'dijkstra_target': time_target,
+                'astar': time_astar,
+                'match': match
+            })
+
+            status = "✓" if match else "✗"
+            print(f"{name:<24} {engine:<10} {time_full:<15.6f} {time_target:<15.6f} {astar_text:<12} {status}")
+
+    print("\n" + "="*70)
+    return results
+
+
+def dijkstra_reference(graph, source):
+    """
+    Эталонный алгоритм Дейкстры для проверки движков: без decrease-key,
+    с дубликатами в PriorityQueue и пропуском устаревших записей
+    """
+    dist = [INF] * graph.num_nodes()
+    dist[source] = 0
+
+    pq = PriorityQueue()
+    pq.enqueue((0, source), 0)
+
+    while not pq.is_empty():
+        du, u = pq.dequeue()
+        if du > dist[u]:
+            continue  # Устаревшая запись
+        for v, weight in graph.neighbors(u):
+            if du + weight < dist[v]:
+                dist[v] = du + weight
+                pq.enqueue((dist[v], v), dist[v])
+
+    return dist
+
+
 def quicksort(arr, low, high):
     """Быстрая сортировка для сравнения"""
     if low < high:
@@ -285,7 +603,255 @@ def mergesort(arr):
             k += 1
 
 
-if __name__ == "__main__":
+# ----------------------------------------------------------------------
+# Рабочие нагрузки и структуры для командной строки
+# ----------------------------------------------------------------------
+
+def workload_random(size, rng):
+    """Случайные значения из широкого диапазона"""
+    return [rng.randint(1, 100000) for _ in range(size)]
+
+
+def workload_sorted(size, rng):
+    """Уже отсортированный массив"""
+    return sorted(workload_random(size, rng))
+
+
+def workload_reversed(size, rng):
+    """
+    Массив по убыванию: каждая вставка в min-heap
+    всплывает до самого корня
+    """
+    return sorted(workload_random(size, rng), reverse=True)
+
+
+def workload_duplicates(size, rng):
+    """Много повторов: всего 10 различных значений"""
+    return [rng.randint(0, 9) for _ in range(size)]
+
+
+def workload_organ_pipe(size, rng):
+    """
+    «Органная труба»: возрастающая половина, затем убывающая
+    Проверяет, что время не зависит от частичной упорядоченности:
+    по числу сравнений совпадает со случайными данными.
+    Худший случай для вставок в min-heap - reversed
+    """
+    values = sorted(workload_random(size, rng))
+    return values[0::2] + values[1::2][::-1]
+
+
+WORKLOADS = {
+    'random': workload_random,
+    'sorted': workload_sorted,
+    'reversed': workload_reversed,
+    'duplicates': workload_duplicates,
+    'organ-pipe': workload_organ_pipe,
+}
+
+
+def run_heap(data, checkpoint=None):
+    """Heap: последовательные вставки, затем извлечение всех элементов"""
+    heap = MinHeap()
+    for value in data:
+        heap.insert(value)
+    if checkpoint is not None:
+        checkpoint()
+    while not heap.is_empty():
+        heap.extract()
+
+
+def run_heap_build(data, checkpoint=None):
+    """Heap: build_heap, затем извлечение всех элементов"""
+    heap = MinHeap()
+    heap.build_heap(data)
+    if checkpoint is not None:
+        checkpoint()
+    while not heap.is_empty():
+        heap.extract()
+
+
+def run_priority_queue(data, checkpoint=None):
+    """PriorityQueue: постановка всех задач, затем извлечение"""
+    pq = PriorityQueue()
+    for index, priority in enumerate(data):
+        pq.enqueue(index, priority)
+    if checkpoint is not None:
+        checkpoint()
+    while not pq.is_empty():
+        pq.dequeue()
+
+
+def run_heapsort(data, checkpoint=None):
+    """heapsort с копированием"""
+    result = heapsort(data)
+    if checkpoint is not None:
+        checkpoint()
+    return result
+
+
+def run_heapsort_inplace(data, checkpoint=None):
+    """heapsort_inplace на копии данных"""
+    result = data.copy()
+    heapsort_inplace(result)
+    if checkpoint is not None:
+        checkpoint()
+    return result
+
+
+def run_heapsort_argsort(data, checkpoint=None):
+    """heapsort_argsort"""
+    result = heapsort_argsort(data)
+    if checkpoint is not None:
+        checkpoint()
+    return result
+
+
+def run_running_median(data, checkpoint=None):
+    """RunningMedian со скользящим окном из 100 отсчетов"""
+    tracker = RunningMedian(window=100)
+    for value in data:
+        tracker.add(value)
+        tracker.value()
+    if checkpoint is not None:
+        checkpoint()
+    return tracker
+
+
+# Каждая функция вызывает checkpoint в момент, когда ее структуры
+# заполнены - там tracemalloc делает снимок, пока память еще занята
+STRUCTURES = {
+    'heap': run_heap,
+    'heap-build': run_heap_build,
+    'priority-queue': run_priority_queue,
+    'heapsort': run_heapsort,
+    'heapsort-inplace': run_heapsort_inplace,
+    'heapsort-argsort': run_heapsort_argsort,
+    'running-median': run_running_median,
+}
+
+
+def benchmark(structures, workloads, sizes, repeat=3, seed=None):
+    """
+    Замер времени для всех сочетаний структуры, нагрузки и размера
+
+    Args:
+        structures: Имена структур из STRUCTURES
+        workloads: Имена нагрузок из WORKLOADS
+        sizes: Размеры входных данных
+        repeat: Количество повторов каждого замера
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        Список словарей с лучшим и средним временем
+    """
+    if repeat < 1:
+        raise ValueError("Количество повторов должно быть положительным")
+
+    rng = random.Random(seed)
+
+    print(f"\n{'Структура':<18} {'Нагрузка':<13} {'Размер':<10} {'Лучшее (с)':<14} {'Среднее (с)'}")
+    print("-" * 70)
+
+    results = []
+
+    for workload in workloads:
+        for size in sizes:
+            data = WORKLOADS[workload](size, rng)
+
+            for structure in structures:
+                run = STRUCTURES[structure]
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    run(data)
+                    timings.append(time.perf_counter() - start)
+
+                best = min(timings)
+                mean = sum(timings) / len(timings)
+                results.append({
+                    'structure': structure,
+                    'workload': workload,
+                    'size': size,
+                    'best': best,
+                    'mean': mean
+                })
+
+                print(f"{structure:<18} {workload:<13} {size:<10} {best:<14.6f} {mean:.6f}")
+
+    return results
+
+
+def profile(structure, workload, size, repeat=1, profiler='cprofile',
+            output=None, top=20, seed=None):
+    """
+    Запуск нагрузки под cProfile или tracemalloc
+
+    Args:
+        structure: Имя структуры из STRUCTURES
+        workload: Имя нагрузки из WORKLOADS
+        size: Размер входных данных
+        repeat: Сколько раз выполнить нагрузку
+        profiler: 'cprofile' (время) или 'tracemalloc' (память)
+        output: Файл для pstats или снимка tracemalloc (None - не сохранять)
+        top: Сколько строк статистики вывести
+        seed: Зерно генератора случайных чисел
+    """
+    if repeat < 1:
+        raise ValueError("Количество повторов должно быть положительным")
+
+    data = WORKLOADS[workload](size, random.Random(seed))
+    run = STRUCTURES[structure]
+
+    print(f"Профилирование: {structure}, нагрузка {workload}, "
+          f"размер {size}, повторов {repeat} ({profiler})\n")
+
+    if profiler == 'cprofile':
+        profiler_obj = cProfile.Profile()
+        profiler_obj.enable()
+        for _ in range(repeat):
+            run(data)
+        profiler_obj.disable()
+
+        if output:
+            profiler_obj.dump_stats(output)
+            print(f"Статистика pstats записана в {output}\n")
+
+        stats = pstats.Stats(profiler_obj)
+        stats.sort_stats('cumulative').print_stats(top)
+    else:
+        tracemalloc.start()
+        # Базовый снимок: входные данные уже созданы и в отчет не попадут
+        baseline = tracemalloc.take_snapshot()
+        snapshots = []
+
+        def checkpoint():
+            snapshots[:] = [tracemalloc.take_snapshot()]
+
+        for _ in range(repeat):
+            run(data, checkpoint)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Собственные выделения tracemalloc в отчет не включаем
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        snapshot = snapshots[-1].filter_traces(ignore)
+        differences = snapshot.compare_to(baseline.filter_traces(ignore), 'lineno')
+
+        if output:
+            snapshot.dump(output)
+            print(f"Снимок tracemalloc записан в {output}\n")
+
+        held = sum(stat.size_diff for stat in differences)
+        print(f"Пик: {peak / 1024:.1f} КБ, после завершения: {current / 1024:.1f} КБ")
+        print(f"Занято структурой в контрольной точке: {held / 1024:.1f} КБ\n")
+        print("Крупнейшие выделения относительно базового снимка:")
+        for stat in differences[:top]:
+            print(stat)
+
+
+def run_demo():
+    """Исходный сценарий: тесты и все сравнения"""
     test_heap_operations()
     print("\n")
 
@@ -295,7 +861,101 @@ if __name__ == "__main__":
     test_priority_queue()
     print("\n")
 
-    build_results = compare_build_methods()
+    test_graph_search()
+    print("\n")
+
+    compare_build_methods()
+    print("\n")
+
+    compare_sorting_algorithms()
     print("\n")
 
-    sort_results = compare_sorting_algorithms()
+    compare_running_median()
+    print("\n")
+
+    compare_merge_methods()
+    print("\n")
+
+    compare_graph_engines(grid_side=50, nodes=2500, edges=12500)
+
+
+def positive_int(text):
+    """Тип аргумента: целое число больше нуля"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"ожидается положительное целое число: {text}")
+    return value
+
+
+def non_negative_int(text):
+    """Тип аргумента: целое число не меньше нуля"""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"ожидается неотрицательное целое число: {text}")
+    return value
+
+
+def build_parser():
+    """Разбор аргументов командной строки"""
+    parser = argparse.ArgumentParser(
+        description="Экспериментальное исследование кучи")
+    subparsers = parser.add_subparsers(dest='command')
+
+    subparsers.add_parser('demo', help="тесты и все сравнения (по умолчанию)")
+
+    bench = subparsers.add_parser('bench', help="замер времени на выбранных нагрузках")
+    bench.add_argument('--structure', nargs='+', choices=sorted(STRUCTURES),
+                       default=sorted(STRUCTURES), help="структуры для замера")
+    bench.add_argument('--workload', nargs='+', choices=sorted(WORKLOADS),
+                       default=['random'], help="тип входных данных")
+    bench.add_argument('--sizes', nargs='+', type=positive_int, default=[1000, 10000],
+                       help="размеры входных данных")
+    bench.add_argument('--repeat', type=positive_int, default=3, help="количество повторов")
+    bench.add_argument('--seed', type=int, default=None, help="зерно генератора")
+
+    prof = subparsers.add_parser('profile', help="запуск нагрузки под профилировщиком")
+    prof.add_argument('--structure', choices=sorted(STRUCTURES), default='heap',
+                      help="структура для профилирования")
+    prof.add_argument('--workload', choices=sorted(WORKLOADS), default='random',
+                      help="тип входных данных")
+    prof.add_argument('--size', type=positive_int, default=10000, help="размер входных данных")
+    prof.add_argument('--repeat', type=positive_int, default=1, help="количество повторов")
+    prof.add_argument('--profiler', choices=['cprofile', 'tracemalloc'],
+                      default='cprofile', help="профилировщик")
+    prof.add_argument('--output', default=None,
+                      help="файл для pstats или снимка tracemalloc")
+    prof.add_argument('--top', type=positive_int, default=20, help="сколько строк статистики вывести")
+    prof.add_argument('--seed', type=int, default=None, help="зерно генератора")
+
+    graph = subparsers.add_parser('graph', help="сравнение движков очереди в Дейкстре и A*")
+    graph.add_argument('--engine', nargs='+', choices=sorted(QUEUE_ENGINES),
+                       default=None, help="движки очереди")
+    graph.add_argument('--grid-side', type=positive_int, default=100, help="сторона решетки")
+    graph.add_argument('--nodes', type=positive_int, default=10000,
+                       help="количество вершин случайного графа")
+    graph.add_argument('--edges', type=non_negative_int, default=50000,
+                       help="количество ребер случайного графа")
+    graph.add_argument('--repeat', type=positive_int, default=1, help="количество повторов")
+    graph.add_argument('--seed', type=int, default=None, help="зерно генератора")
+
+    return parser
+
+
+def main(argv=None):
+    """Точка входа командной строки"""
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'bench':
+        benchmark(args.structure, args.workload, args.sizes, args.repeat, args.seed)
+    elif args.command == 'profile':
+        profile(args.structure, args.workload, args.size, args.repeat,
+                args.profiler, args.output, args.top, args.seed)
+    elif args.command == 'graph':
+        compare_graph_engines(args.grid_side, args.nodes, args.edges, args.repeat,
+                              args.engine, args.seed)
+    else:
+        run_demo()
+
+
+if __name__ == "__main__":
+    main()
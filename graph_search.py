@@ -0,0 +1,331 @@
+# graph_search.py
+
+import random
+from array import array
+from priority_queue import IndexedPriorityQueue, PairingPriorityQueue, RadixPriorityQueue
+
+INF = float('inf')
+
+# Движки очереди: все поддерживают enqueue, dequeue, decrease_key и is_empty
+QUEUE_ENGINES = {
+    'binary': lambda: IndexedPriorityQueue(arity=2),
+    'dary': lambda: IndexedPriorityQueue(arity=4),
+    'pairing': PairingPriorityQueue,
+    'radix': RadixPriorityQueue,  # Только для целых неотрицательных весов
+}
+
+
+class CSRGraph:
+    """
+    Взвешенный ориентированный граф в формате CSR (compressed sparse row)
+    Вершины - целые числа 0..n-1. Исходящие ребра вершины u занимают
+    позиции indptr[u]..indptr[u+1]-1 в массивах indices и weights
+    """
+
+    def __init__(self, indptr, indices, weights):
+        """
+        Инициализация графа из готовых массивов CSR
+
+        Args:
+            indptr: Смещения начала ребер каждой вершины (длина n + 1)
+            indices: Концы ребер
+            weights: Веса ребер (неотрицательные)
+
+        Raises:
+            ValueError: Если массивы не согласованы, есть ребро в несуществующую
+                        вершину или отрицательный вес
+        """
+        if len(indptr) == 0 or indptr[0] != 0 or indptr[-1] != len(indices):
+            raise ValueError("Некорректный массив indptr")
+        if any(indptr[u] > indptr[u + 1] for u in range(len(indptr) - 1)):
+            raise ValueError("Массив indptr должен быть неубывающим")
+        if len(indices) != len(weights):
+            raise ValueError("Длины indices и weights не совпадают")
+        num_nodes = len(indptr) - 1
+        if any(not 0 <= v < num_nodes for v in indices):
+            raise ValueError("Конец ребра вне диапазона вершин")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Веса ребер должны быть неотрицательными")
+
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, num_nodes, edges, directed=True):
+        """
+        Построение графа из списка ребер
+        Временная сложность: O(n + m)
+
+        Args:
+            num_nodes: Количество вершин
+            edges: Итерируемое из троек (u, v, weight)
+            directed: False - каждое ребро добавляется в обе стороны
+
+        Returns:
+            CSRGraph
+
+        Raises:
+            ValueError: Если ребро ссылается на несуществующую вершину
+        """
+        edges = list(edges)
+        if any(not 0 <= u < num_nodes for u, _, _ in edges):
+            raise ValueError("Начало ребра вне диапазона вершин")
+        if not directed:
+            edges += [(v, u, weight) for u, v, weight in edges]
+
+        # Подсчет степеней и префиксные суммы
+        indptr = array('q', [0]) * (num_nodes + 1)
+        for u, _, _ in edges:
+            indptr[u + 1] += 1
+        for u in range(num_nodes):
+            indptr[u + 1] += indptr[u]
+
+        # Раскладываем ребра по позициям
+        indices = array('q', [0]) * len(edges)
+        integral = all(isinstance(weight, int) for _, _, weight in edges)
+        weights = array('q' if integral else 'd', [0]) * len(edges)
+        cursor = array('q', indptr[:-1])
+        for u, v, weight in edges:
+            position = cursor[u]
+            indices[position] = v
+            weights[position] = weight
+            cursor[u] += 1
+
+        return cls(indptr, indices, weights)
+
+    def num_nodes(self):
+        """Количество вершин"""
+        return len(self.indptr) - 1
+
+    def num_edges(self):
+        """Количество ребер"""
+        return len(self.indices)
+
+    def neighbors(self, node):
+        """Пары (сосед, вес) для исходящих ребер вершины"""
+        for position in range(self.indptr[node], self.indptr[node + 1]):
+            yield self.indices[position], self.weights[position]
+
+
+def _has_integer_weights(weights):
+    """Все ли веса целые (для array.array проверяется код типа)"""
+    typecode = getattr(weights, 'typecode', None)
+    if typecode is not None:
+        return typecode not in 'fd'
+    return all(isinstance(weight, int) for weight in weights)
+
+
+def _make_queue(engine, graph):
+    """
+    Создание очереди по имени движка
+
+    Raises:
+        ValueError: Если движок неизвестен или 'radix' выбран для нецелых весов
+    """
+    if engine not in QUEUE_ENGINES:
+        raise ValueError(f"Неизвестный движок очереди: {engine}")
+    if engine == 'radix' and not _has_integer_weights(graph.weights):
+        raise ValueError("Движок 'radix' требует целых неотрицательных весов")
+    return QUEUE_ENGINES[engine]()
+
+
+def dijkstra(graph, source, target=None, engine='binary'):
+    """
+    Алгоритм Дейкстры с decrease-key вместо дубликатов в очереди
+
+    Временная сложность: O((n + m) log n) для бинарной кучи
+
+    Args:
+        graph: CSRGraph
+        source: Стартовая вершина
+        target: Целевая вершина - поиск останавливается, как только
+                она извлечена из очереди (None - все вершины)
+        engine: Движок очереди из QUEUE_ENGINES
+
+    Returns:
+        (dist, prev): списки точных расстояний и предшественников.
+        Для недостижимых вершин, а при раннем выходе и для всех
+        не обработанных до target вершин - INF и -1
+    """
+    n = graph.num_nodes()
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+
+    dist = [INF] * n
+    prev = [-1] * n
+    settled = bytearray(n)
+
+    queue = _make_queue(engine, graph)
+    dist[source] = 0
+    queue.enqueue(source, 0)
+
+    while not queue.is_empty():
+        u = queue.dequeue()
+        settled[u] = 1
+        if u == target:
+            # Достигнутые, но не обработанные вершины хранят лишь верхние
+            # оценки - сбрасываем их, чтобы в результате были только точные расстояния
+            for v in range(n):
+                if not settled[v]:
+                    dist[v] = INF
+                    prev[v] = -1
+            break
+
+        du = dist[u]
+        for position in range(indptr[u], indptr[u + 1]):
+            v = indices[position]
+            if settled[v]:
+                continue
+
+            candidate = du + weights[position]
+            if candidate < dist[v]:
+                if dist[v] == INF:
+                    queue.enqueue(v, candidate)
+                else:
+                    queue.decrease_key(v, candidate)
+                dist[v] = candidate
+                prev[v] = u
+
+    return dist, prev
+
+
+def astar(graph, source, target, heuristic, engine='binary'):
+    """
+    Алгоритм A*: Дейкстра с приоритетом g(v) + h(v)
+
+    Эвристика должна быть согласованной (h(u) <= w(u, v) + h(v),
+    h(target) = 0) - тогда каждая вершина обрабатывается один раз.
+    Для движка 'radix' эвристика должна возвращать целые числа:
+    нецелое значение эвристики приводит к ValueError из RadixPriorityQueue
+
+    Args:
+        graph: CSRGraph
+        source: Стартовая вершина
+        target: Целевая вершина
+        heuristic: Функция вершина -> оценка расстояния до target
+        engine: Движок очереди из QUEUE_ENGINES
+
+    Returns:
+        (distance, path): длина кратчайшего пути и список вершин
+        (INF и [] если target недостижима)
+
+    Raises:
+        ValueError: Если для движка 'radix' веса или значения эвристики не целые
+    """
+    n = graph.num_nodes()
+    indptr = graph.indptr
+    indices = graph.indices
+    weights = graph.weights
+
+    g = [INF] * n
+    prev = [-1] * n
+    settled = bytearray(n)
+
+    queue = _make_queue(engine, graph)
+    g[source] = 0
+    queue.enqueue(source, heuristic(source))
+
+    while not queue.is_empty():
+        u = queue.dequeue()
+        if u == target:
+            return g[u], shortest_path(prev, source, target)
+        settled[u] = 1
+
+        gu = g[u]
+        for position in range(indptr[u], indptr[u + 1]):
+            v = indices[position]
+            if settled[v]:
+                continue
+
+            candidate = gu + weights[position]
+            if candidate < g[v]:
+                # h(v) не меняется, поэтому f(v) уменьшается вместе с g(v)
+                if g[v] == INF:
+                    queue.enqueue(v, candidate + heuristic(v))
+                else:
+                    queue.decrease_key(v, candidate + heuristic(v))
+                g[v] = candidate
+                prev[v] = u
+
+    return INF, []
+
+
+def shortest_path(prev, source, target):
+    """
+    Восстановление пути по массиву предшественников
+
+    Returns:
+        Список вершин от source до target ([] если путь не найден)
+    """
+    if target != source and prev[target] == -1:
+        return []
+
+    path = [target]
+    while path[-1] != source:
+        path.append(prev[path[-1]])
+    path.reverse()
+    return path
+
+
+def grid_graph(rows, cols, max_weight=9, seed=None):
+    """
+    Генерация неориентированной решетки rows x cols со случайными весами
+    Вершина (r, c) имеет номер r * cols + c
+
+    Args:
+        rows: Количество строк
+        cols: Количество столбцов
+        max_weight: Максимальный вес ребра (веса от 1 до max_weight)
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        CSRGraph
+    """
+    rng = random.Random(seed)
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            node = r * cols + c
+            if c + 1 < cols:
+                edges.append((node, node + 1, rng.randint(1, max_weight)))
+            if r + 1 < rows:
+                edges.append((node, node + cols, rng.randint(1, max_weight)))
+    return CSRGraph.from_edges(rows * cols, edges, directed=False)
+
+
+def grid_heuristic(cols, target):
+    """
+    Манхэттенское расстояние до target на решетке из grid_graph
+    Согласованная эвристика, так как минимальный вес ребра равен 1
+    """
+    target_row, target_col = divmod(target, cols)
+
+    def heuristic(node):
+        row, col = divmod(node, cols)
+        return abs(row - target_row) + abs(col - target_col)
+
+    return heuristic
+
+
+def random_graph(num_nodes, num_edges, max_weight=100, seed=None):
+    """
+    Генерация случайного ориентированного графа
+    Ребра i -> i+1 образуют цикл, чтобы все вершины были достижимы
+
+    Args:
+        num_nodes: Количество вершин
+        num_edges: Количество случайных ребер (помимо цикла)
+        max_weight: Максимальный вес ребра (веса от 1 до max_weight)
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        CSRGraph
+    """
+    rng = random.Random(seed)
+    edges = [(u, (u + 1) % num_nodes, rng.randint(1, max_weight)) for u in range(num_nodes)]
+    for _ in range(num_edges):
+        edges.append((rng.randrange(num_nodes), rng.randrange(num_nodes),
+                      rng.randint(1, max_weight)))
+    return CSRGraph.from_edges(num_nodes, edges)
@@ -1,5 +1,8 @@
 # heap.py
 
+import io
+import random
+
 class Heap:
     """
     Универсальная реализация кучи (heap) на основе массива
@@ -113,6 +116,66 @@ class Heap:
 
         return root
 
+    def replace(self, value):
+        """
+        Замена корня новым элементом (извлечение + вставка за один проход)
+        Временная сложность: O(log n) - один проход вместо extract + insert
+
+        Args:
+            value: Новый элемент
+
+        Returns:
+            Прежний корневой элемент
+
+        Raises:
+            IndexError: Если куча пустая
+        """
+        heap = self.heap
+        size = len(heap)
+        if size == 0:
+            raise IndexError("Куча пустая")
+
+        root = heap[0]
+
+        # Погружение снизу вверх (как heapq.heapreplace): "дырка" спускается
+        # до листа по лучшему потомку - одно сравнение на уровень, - затем
+        # новый элемент всплывает от листа. Новый элемент обычно оказывается
+        # внизу, поэтому сравнений почти вдвое меньше, чем в _sift_down.
+        # Сравнения без _compare, так как replace - горячий путь merge
+        index = 0
+        child = 1
+        if self.is_min:
+            while child < size:
+                right = child + 1
+                if right < size and heap[right] < heap[child]:
+                    child = right
+                heap[index] = heap[child]
+                index = child
+                child = 2 * index + 1
+            while index > 0:
+                parent = (index - 1) // 2
+                if not value < heap[parent]:
+                    break
+                heap[index] = heap[parent]
+                index = parent
+        else:
+            while child < size:
+                right = child + 1
+                if right < size and heap[right] > heap[child]:
+                    child = right
+                heap[index] = heap[child]
+                index = child
+                child = 2 * index + 1
+            while index > 0:
+                parent = (index - 1) // 2
+                if not value > heap[parent]:
+                    break
+                heap[index] = heap[parent]
+                index = parent
+
+        heap[index] = value
+        return root
+
     def peek(self):
         """
         Просмотр корня без извлечения
@@ -151,58 +214,142 @@ class Heap:
         """Проверка на пустоту"""
         return len(self.heap) == 0
 
-    def is_valid_heap(self):
+    def is_valid_heap(self, sample=None, rng=None):
         """
         Проверка корректности свойства кучи
-        Временная сложность: O(n)
+        Временная сложность: O(n), при заданном sample - O(sample)
+
+        Args:
+            sample: Сколько случайных родительских узлов проверить
+                    (None - проверить все узлы)
+            rng: Генератор random.Random для выборки (None - собственный
+                 генератор, глобальное состояние random не затрагивается)
+
+        Raises:
+            ValueError: Если sample меньше 1
         """
-        for i in range(len(self.heap)):
+        if sample is not None and sample < 1:
+            raise ValueError("Размер выборки должен быть положительным")
+
+        parents = len(self.heap) // 2
+
+        if sample is None or sample >= parents:
+            indices = range(parents)
+        else:
+            rng = rng or random.Random()
+            indices = (rng.randrange(parents) for _ in range(sample))
+
+        for i in indices:
             left = self._left_child(i)
             right = self._right_child(i)
 
-            # Проверяем левого потомка
-            if left < len(self.heap):
-                if self.is_min and self.heap[i] > self.heap[left]:
-                    return False
-                if not self.is_min and self.heap[i] < self.heap[left]:
-                    return False
+            # Потомок не должен быть "лучше" родителя
+            if self._compare(self.heap[left], self.heap[i]):
+                return False
 
-            # Проверяем правого потомка
-            if right < len(self.heap):
-                if self.is_min and self.heap[i] > self.heap[right]:
-                    return False
-                if not self.is_min and self.heap[i] < self.heap[right]:
-                    return False
+            if right < len(self.heap) and self._compare(self.heap[right], self.heap[i]):
+                return False
 
         return True
 
-    def visualize(self):
+    def visualize(self, out=None, max_depth=None, max_nodes=None, summary=False):
         """
         Текстовая визуализация кучи в виде дерева
+        Обход итеративный, строки пишутся в out по одной
+
+        Args:
+            out: Файлоподобный объект для записи (None - вернуть строку)
+            max_depth: Максимальная глубина вывода (корень - глубина 0)
+            max_nodes: Максимальное количество выводимых узлов - выводятся
+                       верхние уровни, целиком помещающиеся в этот бюджет.
+                       Строки-маркеры "... (N узлов)" в бюджет не входят:
+                       их не больше, чем выведенных узлов, плюс одна
+            summary: Вместо дерева вывести по уровням количество, min и max
+
+        Returns:
+            Строка с визуализацией, если out не задан, иначе None
         """
+        target = io.StringIO() if out is None else out
+
         if not self.heap:
-            return "Куча пустая"
+            target.write("Куча пустая\n")
+        elif summary:
+            self._write_level_summary(target, max_depth)
+        else:
+            self._write_tree(target, max_depth, max_nodes)
+
+        if out is None:
+            return target.getvalue().rstrip("\n")
+        return None
+
+    def _write_tree(self, out, max_depth, max_nodes):
+        """Итеративный обход: правое поддерево, узел, левое поддерево"""
+        size = len(self.heap)
+
+        # Обход in-order, поэтому бюджет узлов переводится в глубину:
+        # берем самые верхние уровни, которые целиком в него помещаются
+        if max_nodes is not None:
+            depth_limit = (max_nodes + 1).bit_length() - 2
+            max_depth = depth_limit if max_depth is None else min(max_depth, depth_limit)
+
+        # Кадр стека: (индекс, префикс, последний ли потомок, пора ли выводить узел)
+        stack = [(0, "", True, False)]
 
-        result = []
-        self._visualize_helper(0, "", True, result)
-        return '\n'.join(result)
+        while stack:
+            index, prefix, is_tail, ready = stack.pop()
+            connector = "└── " if is_tail else "┌── "
 
-    def _visualize_helper(self, index, prefix, is_tail, result):
-        """Рекурсивная визуализация"""
-        if index >= len(self.heap):
-            return
+            if ready:
+                out.write(prefix + connector + str(self.heap[index]) + "\n")
+                continue
 
-        right = self._right_child(index)
-        if right < len(self.heap):
-            new_prefix = prefix + ("│   " if is_tail else "    ")
-            self._visualize_helper(right, new_prefix, False, result)
+            depth = (index + 1).bit_length() - 1
+            if max_depth is not None and depth > max_depth:
+                out.write(prefix + connector + f"... ({self._subtree_size(index)} узлов)\n")
+                continue
+
+            left = self._left_child(index)
+            if left < size:
+                stack.append((left, prefix + ("    " if is_tail else "│   "), True, False))
+
+            stack.append((index, prefix, is_tail, True))
+
+            right = self._right_child(index)
+            if right < size:
+                stack.append((right, prefix + ("│   " if is_tail else "    "), False, False))
+
+    def _write_level_summary(self, out, max_depth):
+        """Сводка по уровням: количество узлов, минимум и максимум"""
+        size = len(self.heap)
+        depth = 0
+        first = 0
+
+        while first < size:
+            if max_depth is not None and depth > max_depth:
+                out.write(f"... еще {size - first} узлов на уровнях глубже {max_depth}\n")
+                return
+
+            last = min(2 * first + 1, size)
+            # map по индексам не создает копию уровня
+            low = min(map(self.heap.__getitem__, range(first, last)))
+            high = max(map(self.heap.__getitem__, range(first, last)))
+            out.write(f"Уровень {depth}: узлов {last - first}, min={low}, max={high}\n")
+
+            depth += 1
+            first = last
+
+    def _subtree_size(self, index):
+        """Количество узлов в поддереве с корнем index"""
+        size = len(self.heap)
+        count = 0
+        first = last = index
 
-        result.append(prefix + ("└── " if is_tail else "┌── ") + str(self.heap[index]))
+        while first < size:
+            count += min(last, size - 1) - first + 1
+            first = self._left_child(first)
+            last = self._right_child(last)
 
-        left = self._left_child(index)
-        if left < len(self.heap):
-            new_prefix = prefix + ("    " if is_tail else "│   ")
-            self._visualize_helper(left, new_prefix, True, result)
+        return count
 
 
 class MinHeap(Heap):
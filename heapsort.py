@@ -1,39 +1,27 @@
 # heapsort.py
 
-from heap import MaxHeap
+import copy
+
 
 def heapsort(array):
     """
-    Сортировка кучей (использует дополнительную память для кучи)
+    Сортировка кучей с копированием
 
     Алгоритм:
-    1. Строим max-heap из массива
-    2. Последовательно извлекаем максимум и добавляем в результат
+    1. Делаем одну копию массива (того же типа, что и исходный)
+    2. Сортируем копию на месте через heapsort_inplace
 
     Временная сложность: O(n log n)
-    Пространственная сложность: O(n)
+    Пространственная сложность: O(n) - только сама копия
 
     Args:
-        array: Массив для сортировки
+        array: Массив для сортировки (не изменяется)
 
     Returns:
-        Отсортированный массив
+        Отсортированная копия массива
     """
-    if len(array) <= 1:
-        return array.copy()
-
-    # Создаем max-heap и строим из массива
-    heap = MaxHeap()
-    heap.build_heap(array)
-
-    # Извлекаем элементы в обратном порядке
-    result = []
-    while not heap.is_empty():
-        result.append(heap.extract())
-
-    # Переворачиваем (т.к. извлекали максимумы)
-    result.reverse()
-
+    result = _copy_sequence(array)
+    heapsort_inplace(result)
     return result
 
 
@@ -41,6 +29,10 @@ def heapsort_inplace(array):
     """
     In-place сортировка кучей (без дополнительной памяти)
 
+    Работает с любой изменяемой последовательностью с индексацией:
+    list, array.array, bytearray, записываемый memoryview, numpy.ndarray.
+    Типизированные данные не преобразуются в список
+
     Алгоритм:
     1. Строим max-heap из массива (модифицируя его на месте)
     2. Последовательно извлекаем максимум (корень) и помещаем его в конец
@@ -71,34 +63,135 @@ def heapsort_inplace(array):
         _sift_down_inplace(array, 0, i)
 
 
+def heapsort_argsort(array):
+    """
+    Сортировка кучей в режиме argsort: сам массив не изменяется
+
+    Возвращает перестановку индексов, упорядочивающую массив.
+    Одной перестановкой можно переупорядочить несколько столбцов,
+    не перемещая сами записи. Сортировка стабильна: равные элементы
+    сохраняют исходный порядок
+
+    Временная сложность: O(n log n)
+    Пространственная сложность: O(n) - под список индексов
+
+    Args:
+        array: Последовательность с индексацией
+
+    Returns:
+        Список индексов indices, такой что array[indices[0]] <= array[indices[1]] <= ...
+    """
+    n = len(array)
+    indices = list(range(n))
+
+    if n <= 1:
+        return indices
+
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down_indexed(indices, array, i, n)
+
+    for i in range(n - 1, 0, -1):
+        indices[0], indices[i] = indices[i], indices[0]
+        _sift_down_indexed(indices, array, 0, i)
+
+    return indices
+
+
+def _copy_sequence(array):
+    """
+    Копия последовательности того же типа, пригодная для сортировки на месте
+
+    Срезы memoryview и numpy.ndarray - это представления, а не копии,
+    поэтому для них копия делается явно
+    """
+    if isinstance(array, memoryview):
+        if array.ndim != 1:
+            raise ValueError("Поддерживаются только одномерные memoryview")
+        return memoryview(bytearray(array.tobytes())).cast(array.format)
+
+    if not hasattr(array, '__setitem__'):
+        # Неизменяемые последовательности (tuple, bytes, range) сортируем как список
+        return list(array)
+
+    if hasattr(array, 'copy'):
+        return array.copy()
+
+    return copy.copy(array)
+
+
 def _sift_down_inplace(array, index, heap_size):
     """
     Погружение элемента для in-place heapsort
 
+    Погружаемый элемент держится в переменной, а потомки сдвигаются
+    вверх на его место - одна запись на уровень вместо обмена
+
     Args:
         array: Массив (содержит кучу)
         index: Индекс элемента для погружения
         heap_size: Текущий размер кучи
     """
-    while True:
-        largest = index
-        left = 2 * index + 1
-        right = 2 * index + 2
-
-        # Находим наибольший из трех элементов
-        if left < heap_size and array[left] > array[largest]:
-            largest = left
+    item = array[index]
+    child = 2 * index + 1
 
-        if right < heap_size and array[right] > array[largest]:
-            largest = right
+    while child < heap_size:
+        # Выбираем наибольшего из потомков
+        right = child + 1
+        if right < heap_size and array[right] > array[child]:
+            child = right
 
         # Если свойство max-heap не нарушено, выходим
-        if largest == index:
+        if not array[child] > item:
             break
 
-        # Меняем местами и продолжаем
-        array[index], array[largest] = array[largest], array[index]
-        index = largest
+        # Поднимаем потомка и спускаемся дальше
+        array[index] = array[child]
+        index = child
+        child = 2 * index + 1
+
+    array[index] = item
+
+
+def _sift_down_indexed(indices, values, index, heap_size):
+    """
+    Погружение индекса для heapsort_argsort
+
+    Индексы сравниваются по парам (values[i], i), поэтому
+    при равных значениях порядок определяется исходной позицией
+
+    Args:
+        indices: Список индексов (содержит кучу)
+        values: Сортируемые значения
+        index: Позиция в indices для погружения
+        heap_size: Текущий размер кучи
+    """
+    item = indices[index]
+    item_value = values[item]
+    child = 2 * index + 1
+
+    while child < heap_size:
+        largest = indices[child]
+        largest_value = values[largest]
+
+        right = child + 1
+        if right < heap_size:
+            candidate = indices[right]
+            candidate_value = values[candidate]
+            if candidate_value > largest_value or (
+                    candidate_value == largest_value and candidate > largest):
+                child = right
+                largest = candidate
+                largest_value = candidate_value
+
+        if not (largest_value > item_value or (
+                largest_value == item_value and largest > item)):
+            break
+
+        indices[index] = largest
+        index = child
+        child = 2 * index + 1
+
+    indices[index] = item
 
 
 def compare_heapsort_methods(array):
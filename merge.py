@@ -0,0 +1,109 @@
+# merge.py
+
+from itertools import islice
+from heap import MinHeap, MaxHeap
+
+# Сколько элементов за раз забирается из каждого источника
+BATCH_SIZE = 256
+
+
+def merge(*iterables, key=None, reverse=False, batch_size=BATCH_SIZE):
+    """
+    Потоковое k-путевое слияние отсортированных последовательностей
+
+    Алгоритм:
+    1. Кладем в кучу первый элемент каждого источника
+    2. Отдаем корень и заменяем его следующим элементом того же источника
+       (replace вместо extract + insert - одно погружение)
+    3. Когда источник исчерпан, просто извлекаем его корень
+
+    Слияние стабильно: при равных ключах первым идет элемент
+    из источника, переданного раньше
+
+    Временная сложность: O(n log k), где k - количество источников
+    Пространственная сложность: O(k * batch_size)
+
+    Args:
+        iterables: Последовательности, отсортированные по key (по убыванию при reverse)
+        key: Функция, вычисляющая ключ сравнения (None - сами элементы)
+        reverse: True, если источники отсортированы по убыванию
+        batch_size: Сколько элементов читать из источника за одно обращение
+
+    Returns:
+        Итератор по элементам всех источников в отсортированном порядке
+
+    Raises:
+        ValueError: Если batch_size меньше 1
+    """
+    # merge - обычная функция, а не генератор, поэтому
+    # некорректные аргументы проверяются сразу при вызове
+    if batch_size < 1:
+        raise ValueError("Размер пачки должен быть положительным")
+
+    return _merge(iterables, key, reverse, batch_size)
+
+
+def _merge(iterables, key, reverse, batch_size):
+    """Генератор слияния для merge (аргументы уже проверены)"""
+    # Для max-heap порядок источников инвертируется, чтобы при равных
+    # ключах по-прежнему побеждал источник с меньшим номером
+    heap = MaxHeap() if reverse else MinHeap()
+    sign = -1 if reverse else 1
+
+    sources = []
+    buffers = []
+    positions = []
+    entries = []
+
+    for iterable in iterables:
+        iterator = iter(iterable)
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            continue
+
+        slot = len(sources)
+        sources.append(iterator)
+        buffers.append(batch)
+        positions.append(1)
+
+        value = batch[0]
+        entries.append((value if key is None else key(value), sign * slot, value))
+
+    # Кортеж (ключ, номер источника, элемент): номера источников в куче
+    # уникальны, поэтому сами элементы никогда не сравниваются
+    heap.build_heap(entries)
+
+    # Массив кучи читается напрямую: peek и size на каждом элементе
+    # заметно дороже самого погружения
+    items = heap.heap
+    replace = heap.replace
+
+    while len(items) > 1:
+        _, order, value = items[0]
+        slot = order * sign
+
+        buffer = buffers[slot]
+        position = positions[slot]
+        if position == len(buffer):
+            buffer = list(islice(sources[slot], batch_size))
+            buffers[slot] = buffer
+            position = 0
+
+        if position < len(buffer):
+            following = buffer[position]
+            positions[slot] = position + 1
+            replace((following if key is None else key(following), order, following))
+        else:
+            heap.extract()
+            buffers[slot] = None
+            sources[slot] = None
+
+        yield value
+
+    # Остался один источник - отдаем его без участия кучи
+    if items:
+        _, order, value = items.pop()
+        slot = order * sign
+        yield value
+        yield from islice(buffers[slot], positions[slot], None)
+        yield from sources[slot]
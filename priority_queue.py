@@ -137,3 +137,456 @@ class MaxPriorityQueue:
     def size(self):
         """Размер очереди"""
         return self.heap.size()
+
+
+class IndexedPriorityQueue:
+    """
+    Индексированная приоритетная очередь на основе d-арной min-heap
+    Хранит позицию каждого элемента в массиве кучи, поэтому
+    поддерживает уменьшение приоритета (decrease-key) без дубликатов
+
+    Элементы должны быть хешируемыми и уникальными
+    """
+
+    def __init__(self, arity=2):
+        """
+        Инициализация очереди
+
+        Args:
+            arity: Количество потомков у узла (2 - бинарная куча)
+
+        Raises:
+            ValueError: Если arity меньше 2
+        """
+        if arity < 2:
+            raise ValueError("Арность кучи должна быть не меньше 2")
+
+        self.arity = arity
+        self.heap = []       # Элементы в порядке кучи
+        self.keys = {}       # Элемент -> (приоритет, порядковый номер)
+        self.positions = {}  # Элемент -> индекс в self.heap
+        self.counter = 0     # Счетчик для сохранения порядка при равных приоритетах
+
+    def _sift_up(self, index):
+        """
+        Всплытие элемента: родители сдвигаются вниз на его место
+        Временная сложность: O(log_d n)
+        """
+        heap = self.heap
+        keys = self.keys
+        positions = self.positions
+        item = heap[index]
+        key = keys[item]
+
+        while index > 0:
+            parent = (index - 1) // self.arity
+            parent_item = heap[parent]
+            if not key < keys[parent_item]:
+                break
+            heap[index] = parent_item
+            positions[parent_item] = index
+            index = parent
+
+        heap[index] = item
+        positions[item] = index
+
+    def _sift_down(self, index):
+        """
+        Погружение элемента: лучший потомок поднимается на его место
+        Временная сложность: O(d log_d n)
+        """
+        heap = self.heap
+        keys = self.keys
+        positions = self.positions
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+
+        while True:
+            first = self.arity * index + 1
+            if first >= size:
+                break
+
+            # Ищем потомка с наименьшим ключом
+            best = first
+            best_key = keys[heap[first]]
+            for child in range(first + 1, min(first + self.arity, size)):
+                child_key = keys[heap[child]]
+                if child_key < best_key:
+                    best = child
+                    best_key = child_key
+
+            if not best_key < key:
+                break
+
+            heap[index] = heap[best]
+            positions[heap[index]] = index
+            index = best
+
+        heap[index] = item
+        positions[item] = index
+
+    def enqueue(self, item, priority):
+        """
+        Добавление элемента с приоритетом
+        Временная сложность: O(log_d n)
+
+        Raises:
+            ValueError: Если элемент уже в очереди
+        """
+        if item in self.positions:
+            raise ValueError("Элемент уже в очереди")
+
+        self.keys[item] = (priority, self.counter)
+        self.counter += 1
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def dequeue(self):
+        """
+        Извлечение элемента с наименьшим приоритетом
+        Временная сложность: O(d log_d n)
+
+        Raises:
+            IndexError: Если очередь пустая
+        """
+        if self.is_empty():
+            raise IndexError("Очередь пустая")
+
+        root = self.heap[0]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self._sift_down(0)
+
+        del self.keys[root]
+        del self.positions[root]
+        return root
+
+    def decrease_key(self, item, priority):
+        """
+        Уменьшение приоритета элемента, который уже в очереди
+        Временная сложность: O(log_d n)
+
+        Raises:
+            KeyError: Если элемента нет в очереди
+            ValueError: Если новый приоритет больше текущего
+        """
+        old_priority, order = self.keys[item]
+        if priority > old_priority:
+            raise ValueError("Новый приоритет больше текущего")
+
+        self.keys[item] = (priority, order)
+        self._sift_up(self.positions[item])
+
+    def priority(self, item):
+        """Текущий приоритет элемента"""
+        return self.keys[item][0]
+
+    def peek(self):
+        """
+        Просмотр элемента с наименьшим приоритетом
+        Временная сложность: O(1)
+
+        Raises:
+            IndexError: Если очередь пустая
+        """
+        if self.is_empty():
+            raise IndexError("Очередь пустая")
+        return self.heap[0]
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def is_empty(self):
+        """Проверка на пустоту"""
+        return len(self.heap) == 0
+
+    def size(self):
+        """Размер очереди"""
+        return len(self.heap)
+
+
+class _PairingNode:
+    """Узел pairing-кучи"""
+    __slots__ = ('item', 'priority', 'child', 'sibling', 'prev')
+
+    def __init__(self, item, priority):
+        self.item = item
+        self.priority = priority
+        self.child = None    # Самый левый потомок
+        self.sibling = None  # Правый сосед
+        self.prev = None     # Левый сосед или родитель для самого левого потомка
+
+
+class PairingPriorityQueue:
+    """
+    Приоритетная очередь на основе pairing-кучи (min)
+    Вставка и decrease-key за O(1), извлечение - O(log n) амортизированно
+
+    Элементы должны быть хешируемыми и уникальными
+    """
+
+    def __init__(self):
+        """Инициализация приоритетной очереди"""
+        self.root = None
+        self.nodes = {}  # Элемент -> узел
+
+    def _meld(self, a, b):
+        """Слияние двух деревьев: корень с большим приоритетом становится потомком"""
+        if b.priority < a.priority:
+            a, b = b, a
+
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def enqueue(self, item, priority):
+        """
+        Добавление элемента с приоритетом
+        Временная сложность: O(1)
+
+        Raises:
+            ValueError: Если элемент уже в очереди
+        """
+        if item in self.nodes:
+            raise ValueError("Элемент уже в очереди")
+
+        node = _PairingNode(item, priority)
+        self.nodes[item] = node
+        self.root = node if self.root is None else self._meld(self.root, node)
+
+    def dequeue(self):
+        """
+        Извлечение элемента с наименьшим приоритетом
+        Временная сложность: O(log n) амортизированно
+
+        Алгоритм двух проходов: потомки корня сливаются попарно
+        слева направо, затем результаты - справа налево
+
+        Raises:
+            IndexError: Если очередь пустая
+        """
+        if self.root is None:
+            raise IndexError("Очередь пустая")
+
+        root = self.root
+        del self.nodes[root.item]
+
+        # Проход 1: попарное слияние слева направо
+        pairs = []
+        node = root.child
+        while node is not None:
+            first = node
+            second = node.sibling
+            node = second.sibling if second is not None else None
+
+            first.prev = first.sibling = None
+            if second is not None:
+                second.prev = second.sibling = None
+                first = self._meld(first, second)
+            pairs.append(first)
+
+        # Проход 2: слияние справа налево
+        merged = pairs.pop() if pairs else None
+        while pairs:
+            merged = self._meld(pairs.pop(), merged)
+
+        self.root = merged
+        return root.item
+
+    def decrease_key(self, item, priority):
+        """
+        Уменьшение приоритета элемента, который уже в очереди
+        Временная сложность: O(1) (амортизированная оценка - открытый вопрос)
+
+        Raises:
+            KeyError: Если элемента нет в очереди
+            ValueError: Если новый приоритет больше текущего
+        """
+        node = self.nodes[item]
+        if priority > node.priority:
+            raise ValueError("Новый приоритет больше текущего")
+
+        node.priority = priority
+        if node is self.root:
+            return
+
+        # Вырезаем поддерево узла и сливаем его с корнем
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+        self.root = self._meld(self.root, node)
+
+    def priority(self, item):
+        """Текущий приоритет элемента"""
+        return self.nodes[item].priority
+
+    def peek(self):
+        """
+        Просмотр элемента с наименьшим приоритетом
+        Временная сложность: O(1)
+
+        Raises:
+            IndexError: Если очередь пустая
+        """
+        if self.root is None:
+            raise IndexError("Очередь пустая")
+        return self.root.item
+
+    def __contains__(self, item):
+        return item in self.nodes
+
+    def is_empty(self):
+        """Проверка на пустоту"""
+        return self.root is None
+
+    def size(self):
+        """Размер очереди"""
+        return len(self.nodes)
+
+
+class RadixPriorityQueue:
+    """
+    Монотонная приоритетная очередь на основе radix-кучи
+    Приоритеты - неотрицательные целые числа, и новый приоритет
+    не может быть меньше последнего извлеченного (как в алгоритме Дейкстры)
+
+    Элемент с приоритетом p лежит в корзине номер (p ^ last).bit_length(),
+    где last - последний извлеченный приоритет. Каждый элемент
+    перекладывается не более O(log C) раз, C - максимальный приоритет
+
+    Элементы должны быть хешируемыми и уникальными
+    """
+
+    def __init__(self):
+        """Инициализация приоритетной очереди"""
+        self.buckets = [{}]   # Корзина: элемент -> приоритет
+        self.priorities = {}  # Элемент -> приоритет
+        self.last = 0         # Последний извлеченный приоритет
+
+    def _bucket(self, priority):
+        """Корзина для приоритета (создается при необходимости)"""
+        index = (priority ^ self.last).bit_length()
+        while len(self.buckets) <= index:
+            self.buckets.append({})
+        return self.buckets[index]
+
+    def _check_priority(self, priority):
+        """
+        Проверка приоритета: целое число не меньше последнего извлеченного
+
+        Raises:
+            ValueError: Если приоритет не целый или меньше last
+        """
+        if not isinstance(priority, int):
+            raise ValueError("Приоритеты radix-кучи должны быть целыми числами")
+        if priority < self.last:
+            raise ValueError("Приоритет меньше последнего извлеченного")
+
+    def enqueue(self, item, priority):
+        """
+        Добавление элемента с приоритетом
+        Временная сложность: O(1)
+
+        Raises:
+            ValueError: Если элемент уже в очереди, приоритет не целый
+                        или меньше последнего извлеченного
+        """
+        if item in self.priorities:
+            raise ValueError("Элемент уже в очереди")
+        self._check_priority(priority)
+
+        self.priorities[item] = priority
+        self._bucket(priority)[item] = priority
+
+    def _settle(self):
+        """
+        Перенос минимальных элементов в корзину 0
+        Временная сложность: O(log C) амортизированно
+        """
+        if self.buckets[0]:
+            return
+
+        index = 1
+        while not self.buckets[index]:
+            index += 1
+
+        bucket = self.buckets[index]
+        self.buckets[index] = {}
+        self.last = min(bucket.values())
+
+        # Все элементы корзины попадают в корзины с меньшими номерами
+        for item, priority in bucket.items():
+            self._bucket(priority)[item] = priority
+
+    def dequeue(self):
+        """
+        Извлечение элемента с наименьшим приоритетом
+        Временная сложность: O(log C) амортизированно
+
+        Raises:
+            IndexError: Если очередь пустая
+        """
+        if self.is_empty():
+            raise IndexError("Очередь пустая")
+
+        self._settle()
+        item, _ = self.buckets[0].popitem()
+        del self.priorities[item]
+        return item
+
+    def decrease_key(self, item, priority):
+        """
+        Уменьшение приоритета элемента, который уже в очереди
+        Временная сложность: O(1)
+
+        Raises:
+            KeyError: Если элемента нет в очереди
+            ValueError: Если новый приоритет не целый, больше текущего
+                        или меньше последнего извлеченного
+        """
+        old_priority = self.priorities[item]
+        self._check_priority(priority)
+        if priority > old_priority:
+            raise ValueError("Новый приоритет больше текущего")
+
+        del self._bucket(old_priority)[item]
+        self.priorities[item] = priority
+        self._bucket(priority)[item] = priority
+
+    def priority(self, item):
+        """Текущий приоритет элемента"""
+        return self.priorities[item]
+
+    def peek(self):
+        """
+        Просмотр элемента с наименьшим приоритетом
+
+        Raises:
+            IndexError: Если очередь пустая
+        """
+        if self.is_empty():
+            raise IndexError("Очередь пустая")
+
+        self._settle()
+        return next(iter(self.buckets[0]))
+
+    def __contains__(self, item):
+        return item in self.priorities
+
+    def is_empty(self):
+        """Проверка на пустоту"""
+        return len(self.priorities) == 0
+
+    def size(self):
+        """Размер очереди"""
+        return len(self.priorities)
@@ -0,0 +1,240 @@
+# running_median.py
+
+from collections import deque
+from heap import MinHeap, MaxHeap
+
+class RunningQuantile:
+    """
+    Потоковый трекер квантиля на основе двух куч
+    Нижняя половина хранится в max-heap, верхняя - в min-heap,
+    поэтому квантиль всегда находится на вершинах куч
+    """
+
+    def __init__(self, q=0.5, window=None):
+        """
+        Инициализация трекера
+
+        Args:
+            q: Квантиль в диапазоне [0, 1] (0.5 - медиана)
+            window: Размер скользящего окна (None - без ограничения)
+
+        Raises:
+            ValueError: Если q или window вне допустимого диапазона
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Квантиль должен быть в диапазоне [0, 1]")
+        if window is not None and window < 1:
+            raise ValueError("Размер окна должен быть положительным")
+
+        self.q = q
+        self.window = window
+        self.samples = deque() if window is not None else None
+        # Отсчеты окна, удаленные через remove: value -> количество.
+        # Из очереди окна они выбрасываются лениво, когда доходят до ее начала
+        self.samples_removed = {}
+
+        self.lower = MaxHeap()  # Элементы не больше квантиля
+        self.upper = MinHeap()  # Элементы не меньше квантиля
+
+        # Количество действительных (не удаленных) элементов в каждой куче
+        self.lower_size = 0
+        self.upper_size = 0
+
+        # Отложенные удаления: значение -> сколько раз его нужно выбросить
+        self.lower_delayed = {}
+        self.upper_delayed = {}
+        self.lower_delayed_count = 0
+        self.upper_delayed_count = 0
+
+        # Действительные отсчеты: значение -> количество (для проверки remove)
+        self.counts = {}
+
+    def add(self, value):
+        """
+        Добавление нового отсчета
+        Временная сложность: O(log n)
+
+        Если задан размер окна, самый старый отсчет выталкивается из окна
+        """
+        if self.lower_size == 0 or value <= self.lower.peek():
+            self.lower.insert(value)
+            self.lower_size += 1
+        else:
+            self.upper.insert(value)
+            self.upper_size += 1
+        self.counts[value] = self.counts.get(value, 0) + 1
+
+        if self.samples is not None:
+            self.samples.append(value)
+            if self.size() > self.window:
+                self._remove(self._pop_oldest())
+
+        self._rebalance()
+
+    def remove(self, value):
+        """
+        Удаление ранее добавленного отсчета (ленивое)
+        Временная сложность: O(log n) амортизированно
+
+        Args:
+            value: Значение, которое уже было добавлено в трекер
+
+        Raises:
+            IndexError: Если трекер пустой
+            ValueError: Если такого значения нет среди отсчетов
+        """
+        if self.size() == 0:
+            raise IndexError("Трекер пустой")
+        if self.counts.get(value, 0) == 0:
+            raise ValueError("Значение отсутствует в трекере")
+        if self.samples is not None:
+            # deque.remove - O(window), поэтому только помечаем отсчет
+            self.samples_removed[value] = self.samples_removed.get(value, 0) + 1
+        self._remove(value)
+        self._rebalance()
+
+    def _pop_oldest(self):
+        """
+        Извлечение самого старого действительного отсчета окна
+        Временная сложность: O(1) амортизированно
+
+        Первое встреченное вхождение помеченного значения - самое старое,
+        то есть именно то, которое удалил бы deque.remove
+        """
+        while True:
+            value = self.samples.popleft()
+            count = self.samples_removed.get(value, 0)
+            if count == 0:
+                return value
+            if count == 1:
+                del self.samples_removed[value]
+            else:
+                self.samples_removed[value] = count - 1
+
+    def _remove(self, value):
+        """Пометка значения как удаленного в той куче, где оно лежит"""
+        count = self.counts[value]
+        if count == 1:
+            del self.counts[value]
+        else:
+            self.counts[value] = count - 1
+
+        # Все действительные элементы lower не больше элементов upper,
+        # поэтому значение <= вершины lower гарантированно есть в lower
+        if self.lower_size > 0 and value <= self.lower.peek():
+            self.lower_delayed[value] = self.lower_delayed.get(value, 0) + 1
+            self.lower_delayed_count += 1
+            self.lower_size -= 1
+            self._prune(self.lower, self.lower_delayed)
+        else:
+            self.upper_delayed[value] = self.upper_delayed.get(value, 0) + 1
+            self.upper_delayed_count += 1
+            self.upper_size -= 1
+            self._prune(self.upper, self.upper_delayed)
+
+        self._compact()
+
+    def _prune(self, heap, delayed):
+        """Выбрасывание удаленных элементов с вершины кучи"""
+        while not heap.is_empty():
+            top = heap.peek()
+            count = delayed.get(top, 0)
+            if count == 0:
+                break
+            heap.extract()
+            if count == 1:
+                del delayed[top]
+            else:
+                delayed[top] = count - 1
+            if heap is self.lower:
+                self.lower_delayed_count -= 1
+            else:
+                self.upper_delayed_count -= 1
+
+    def _compact(self):
+        """
+        Перестроение кучи, если удаленных элементов в ней больше,
+        чем действительных - ограничивает память при скользящем окне
+        Временная сложность: O(n), амортизированно O(1) на удаление
+        """
+        if self.lower_delayed_count > self.lower_size:
+            self._rebuild(self.lower, self.lower_delayed)
+            self.lower_delayed_count = 0
+        if self.upper_delayed_count > self.upper_size:
+            self._rebuild(self.upper, self.upper_delayed)
+            self.upper_delayed_count = 0
+
+    def _rebuild(self, heap, delayed):
+        """Построение кучи заново только из действительных элементов"""
+        alive = []
+        for value in heap.heap:
+            count = delayed.get(value, 0)
+            if count > 0:
+                delayed[value] = count - 1
+            else:
+                alive.append(value)
+        delayed.clear()
+        heap.build_heap(alive)
+
+    def _target_lower_size(self):
+        """Сколько элементов должно лежать в нижней куче"""
+        n = self.size()
+        if n == 0:
+            return 0
+        return int(self.q * (n - 1)) + 1
+
+    def _rebalance(self):
+        """Перенос вершин между кучами до нужного соотношения размеров"""
+        target = self._target_lower_size()
+
+        while self.lower_size > target:
+            self.upper.insert(self.lower.extract())
+            self.lower_size -= 1
+            self.upper_size += 1
+            self._prune(self.lower, self.lower_delayed)
+
+        while self.lower_size < target:
+            self.lower.insert(self.upper.extract())
+            self.upper_size -= 1
+            self.lower_size += 1
+            self._prune(self.upper, self.upper_delayed)
+
+    def value(self):
+        """
+        Текущее значение квантиля
+        Временная сложность: O(1)
+
+        Между соседними порядковыми статистиками используется
+        линейная интерполяция (как в numpy.quantile по умолчанию)
+
+        Returns:
+            Значение квантиля
+
+        Raises:
+            IndexError: Если трекер пустой
+        """
+        n = self.size()
+        if n == 0:
+            raise IndexError("Трекер пустой")
+
+        position = self.q * (n - 1)
+        fraction = position - int(position)
+        low = self.lower.peek()
+
+        if fraction == 0 or self.upper_size == 0:
+            return low
+        return low + (self.upper.peek() - low) * fraction
+
+    def size(self):
+        """Количество отсчетов в трекере"""
+        return self.lower_size + self.upper_size
+
+    def is_empty(self):
+        """Проверка на пустоту"""
+        return self.size() == 0
+
+
+class RunningMedian(RunningQuantile):
+    """Потоковая медиана: квантиль уровня 0.5"""
+    def __init__(self, window=None):
+        super().__init__(q=0.5, window=window)